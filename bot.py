@@ -4,11 +4,16 @@ A Telegram bot that evaluates PCOS risk using weighted scoring
 """
 
 import telebot
-from telebot import types
+from telebot import types, apihelper
+import requests
+from requests.adapters import HTTPAdapter
 import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from threading import Thread
-from flask import Flask
+from threading import Lock
+from flask import Flask, request, abort
 
 # Initialize Flask app for Render health checks
 app = Flask(__name__)
@@ -25,8 +30,71 @@ def health():
 BOT_TOKEN = os.getenv('BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
 bot = telebot.TeleBot(BOT_TOKEN)
 
+# Share one keep-alive connection pool across all outbound Bot API calls
+apihelper.session = requests.Session()
+apihelper.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1))
+apihelper.SESSION_TIME_TO_LIVE = None
+
+# Public URL of the service (set automatically by Render)
+RENDER_EXTERNAL_URL = os.getenv('RENDER_EXTERNAL_URL')
+
+
+@app.route(f'/{BOT_TOKEN}', methods=['POST'])
+def webhook():
+    """Receive updates pushed by Telegram"""
+    if request.headers.get('content-type') != 'application/json':
+        abort(403)
+    json_string = request.stream.read().decode('utf-8')
+    update = types.Update.de_json(json_string)
+    bot.process_new_updates([update])
+    return ''
+
 # User data storage (in production, use a database)
-user_data = {}
+# Bounded LRU: least recently active users are evicted once MAX_USERS is reached,
+# and sessions idle for longer than SESSION_TTL seconds are discarded
+MAX_USERS = 10_000
+SESSION_TTL = 30 * 60
+user_data = OrderedDict()
+user_data_lock = Lock()
+
+
+@dataclass(slots=True)
+class Session:
+    """Assessment state for a single user"""
+    stage: str = ''
+    cycle_regularity: str = 'Regular'
+    cycle_length: str = '28'
+    sym_mask: int = 0
+    ts: float = 0.0
+
+
+def get_user(user_id):
+    """Return the session for a user (or None) and mark it as recently used"""
+    now = time.monotonic()
+    with user_data_lock:
+        data = user_data.get(user_id)
+        if data is None:
+            return None
+        if now - data.ts > SESSION_TTL:
+            del user_data[user_id]
+            return None
+        data.ts = now
+        user_data.move_to_end(user_id)
+        return data
+
+
+def set_user(user_id, data):
+    """Store the session for a user, evicting the least recently used ones"""
+    now = time.monotonic()
+    data.ts = now
+    with user_data_lock:
+        user_data[user_id] = data
+        user_data.move_to_end(user_id)
+        while len(user_data) > MAX_USERS:
+            user_data.popitem(last=False)
+        # Oldest sessions sit at the front, so stop at the first live one
+        while now - next(iter(user_data.values())).ts > SESSION_TTL:
+            user_data.popitem(last=False)
 
 # Weighted scoring system
 WEIGHTS = {
@@ -49,6 +117,29 @@ WEIGHTS = {
     }
 }
 
+# Precomputed cycle length weight for every day count up to MAX_CYCLE_DAYS
+MAX_CYCLE_DAYS = 399
+CYCLE_LENGTH_WEIGHT = tuple(
+    WEIGHTS['cycle_length']['normal'] if 21 <= days <= 35
+    else WEIGHTS['cycle_length']['short'] if days < 21
+    else WEIGHTS['cycle_length']['long']
+    for days in range(MAX_CYCLE_DAYS + 1)
+)
+
+# Selected symptoms are stored as a bitmask of these flags
+SYMPTOM_BIT = {
+    'Acne': 1,
+    'Facial Hair': 2,
+    'Weight Gain': 4,
+    'Hair Thinning': 8
+}
+WEIGHT_BY_BIT = {bit: WEIGHTS['symptoms'][name] for name, bit in SYMPTOM_BIT.items()}
+
+
+def symptom_names(mask):
+    """List the symptom names set in a bitmask"""
+    return [name for name, bit in SYMPTOM_BIT.items() if mask & bit]
+
 class PCOSScorer:
     """Calculates PCOS risk based on weighted symptoms"""
     
@@ -60,14 +151,11 @@ class PCOSScorer:
         
         try:
             days = int(length)
-            if 21 <= days <= 35:
-                return WEIGHTS['cycle_length']['normal']
-            elif days < 21:
-                return WEIGHTS['cycle_length']['short']
-            else:
-                return WEIGHTS['cycle_length']['long']
-        except:
+        except ValueError:
             return 0
+        
+        # Out-of-range lengths fall into the same bucket as the table edges
+        return CYCLE_LENGTH_WEIGHT[min(max(days, 0), MAX_CYCLE_DAYS)]
     
     @staticmethod
     def calculate_total_score(data):
@@ -75,17 +163,18 @@ class PCOSScorer:
         score = 0
         
         # Cycle regularity weight (highest impact)
-        regularity = data.get('cycle_regularity', 'Regular')
+        regularity = data.cycle_regularity
         score += WEIGHTS['cycle_regularity'].get(regularity, 0)
         
         # Cycle length weight
-        cycle_length = data.get('cycle_length', '28')
+        cycle_length = data.cycle_length
         score += PCOSScorer.calculate_cycle_length_weight(cycle_length, regularity)
         
-        # Physical symptoms weight
-        symptoms = data.get('symptoms', [])
-        for symptom in symptoms:
-            score += WEIGHTS['symptoms'].get(symptom, 0)
+        # Physical symptoms weight (visit each set bit, lowest first)
+        mask = data.sym_mask
+        while mask:
+            score += WEIGHT_BY_BIT[mask & -mask]
+            mask &= mask - 1
         
         # Convert to percentage (max possible score ~100)
         max_score = 100
@@ -104,56 +193,59 @@ class PCOSScorer:
             return "High"
 
 
+# Recommendation templates per risk level ({percentage} is filled in per report)
+RECO_MSGS = {
+    "Low": "🟢 **Low Risk Detected ({percentage}%)**\n\nYour symptoms suggest a low risk of PCOS. However, maintaining healthy habits is essential for prevention.",
+    "Medium": "🟡 **Medium Risk Detected ({percentage}%)**\n\nModerate symptoms detected. Hormonal imbalance is likely. Lifestyle modifications and medical consultation recommended.",
+    "High": "🔴 **High Risk Detected ({percentage}%)**\n\n⚠️ High PCOS probability detected. Clinical intervention is strongly advised. Please consult a gynecologist urgently."
+}
+
+RECO_LISTS = {
+    "Low": (
+        "🏃‍♀️ **Exercise**: Light cardio 4-5 times a week (30 min)",
+        "🥗 **Nutrition**: Focus on complex carbs (whole grains, quinoa, oats)",
+        "⚖️ **BMI Management**: Maintain healthy weight (BMI 18.5-24.9)",
+        "😴 **Sleep**: Maintain consistent 7-8 hour sleep cycle",
+        "💧 **Hydration**: Drink 2-3 liters of water daily",
+        "🧘‍♀️ **Stress**: Practice relaxation techniques regularly"
+    ),
+    "Medium": (
+        "🍵 **Spearmint Tea**: Drink 2 cups daily (helps reduce androgens)",
+        "🏋️‍♀️ **HIIT Exercise**: 3x per week (20-30 min sessions)",
+        "🩸 **Blood Tests**: Consult doctor for LH/FSH ratio, testosterone, insulin levels",
+        "🥑 **Diet**: Low glycemic index foods, increase fiber intake",
+        "🌰 **Seed Cycling**: Flax/pumpkin seeds (Days 1-14), Sesame/sunflower (Days 15-28)",
+        "⏰ **Meal Timing**: Avoid late-night eating, maintain regular meal schedule",
+        "📊 **Track Symptoms**: Keep a menstrual and symptom diary",
+        "💊 **Supplements**: Consider Inositol, Vitamin D (consult doctor first)"
+    ),
+    "High": (
+        "🏥 **URGENT**: Schedule gynecological consultation within 1-2 weeks",
+        "🔬 **Ultrasound Scan**: Get transvaginal ultrasound for ovarian assessment",
+        "🩺 **Comprehensive Tests**: Complete hormonal panel, glucose tolerance test",
+        "🚫 **Strict Low-GI Diet**: Eliminate processed sugars, refined carbs",
+        "🌾 **Seed Cycling**: Implement hormone regulation protocol",
+        "💊 **Medical Management**: Discuss Metformin, birth control with doctor",
+        "⚖️ **Weight Management**: If BMI >25, aim for 5-10% weight loss",
+        "🧘‍♀️ **Stress Management**: Daily meditation/yoga (cortisol control)",
+        "📝 **Document Everything**: Keep detailed symptom and cycle records"
+    )
+}
+
+
 def get_recommendations(risk_category, percentage):
     """Generate personalized recommendations based on risk level"""
+    if risk_category not in RECO_MSGS:
+        risk_category = "Low"
     
-    recommendations = {
-        "Low": {
-            "message": f"🟢 **Low Risk Detected ({percentage}%)**\n\nYour symptoms suggest a low risk of PCOS. However, maintaining healthy habits is essential for prevention.",
-            "recommendations": [
-                "🏃‍♀️ **Exercise**: Light cardio 4-5 times a week (30 min)",
-                "🥗 **Nutrition**: Focus on complex carbs (whole grains, quinoa, oats)",
-                "⚖️ **BMI Management**: Maintain healthy weight (BMI 18.5-24.9)",
-                "😴 **Sleep**: Maintain consistent 7-8 hour sleep cycle",
-                "💧 **Hydration**: Drink 2-3 liters of water daily",
-                "🧘‍♀️ **Stress**: Practice relaxation techniques regularly"
-            ]
-        },
-        "Medium": {
-            "message": f"🟡 **Medium Risk Detected ({percentage}%)**\n\nModerate symptoms detected. Hormonal imbalance is likely. Lifestyle modifications and medical consultation recommended.",
-            "recommendations": [
-                "🍵 **Spearmint Tea**: Drink 2 cups daily (helps reduce androgens)",
-                "🏋️‍♀️ **HIIT Exercise**: 3x per week (20-30 min sessions)",
-                "🩸 **Blood Tests**: Consult doctor for LH/FSH ratio, testosterone, insulin levels",
-                "🥑 **Diet**: Low glycemic index foods, increase fiber intake",
-                "🌰 **Seed Cycling**: Flax/pumpkin seeds (Days 1-14), Sesame/sunflower (Days 15-28)",
-                "⏰ **Meal Timing**: Avoid late-night eating, maintain regular meal schedule",
-                "📊 **Track Symptoms**: Keep a menstrual and symptom diary",
-                "💊 **Supplements**: Consider Inositol, Vitamin D (consult doctor first)"
-            ]
-        },
-        "High": {
-            "message": f"🔴 **High Risk Detected ({percentage}%)**\n\n⚠️ High PCOS probability detected. Clinical intervention is strongly advised. Please consult a gynecologist urgently.",
-            "recommendations": [
-                "🏥 **URGENT**: Schedule gynecological consultation within 1-2 weeks",
-                "🔬 **Ultrasound Scan**: Get transvaginal ultrasound for ovarian assessment",
-                "🩺 **Comprehensive Tests**: Complete hormonal panel, glucose tolerance test",
-                "🚫 **Strict Low-GI Diet**: Eliminate processed sugars, refined carbs",
-                "🌾 **Seed Cycling**: Implement hormone regulation protocol",
-                "💊 **Medical Management**: Discuss Metformin, birth control with doctor",
-                "⚖️ **Weight Management**: If BMI >25, aim for 5-10% weight loss",
-                "🧘‍♀️ **Stress Management**: Daily meditation/yoga (cortisol control)",
-                "📝 **Document Everything**: Keep detailed symptom and cycle records"
-            ]
-        }
+    return {
+        "message": RECO_MSGS[risk_category].format(percentage=percentage),
+        "recommendations": RECO_LISTS[risk_category]
     }
-    
-    return recommendations.get(risk_category, recommendations["Low"])
 
 
-def get_daily_precautions():
-    """Return universal daily precautions for all users"""
-    return """
+# Static message texts
+DAILY_PRECAUTIONS = """
 ━━━━━━━━━━━━━━━━━━━━━━
 📋 **DAILY PRECAUTIONS**
 ━━━━━━━━━━━━━━━━━━━━━━
@@ -192,16 +284,7 @@ def get_daily_precautions():
    • Eat every 3-4 hours to stabilize blood sugar
 """
 
-
-# Bot Commands
-
-@bot.message_handler(commands=['start'])
-def start(message):
-    """Welcome message and introduction"""
-    user_id = message.from_user.id
-    user_data[user_id] = {}
-    
-    welcome_text = """
+WELCOME_TEXT = """
 🌸 **Welcome to PCOS Care AI** 🌸
 
 I'm your automated PCOS risk assessment assistant. I'll help you understand your risk level through a series of simple questions.
@@ -221,15 +304,9 @@ I'm your automated PCOS risk assessment assistant. I'll help you understand your
 **Privacy:** Your data is used only for this assessment and not shared.
 
 Ready to begin? Type /assess to start! 🚀
-    """
-    
-    bot.send_message(message.chat.id, welcome_text, parse_mode='Markdown')
-
+"""
 
-@bot.message_handler(commands=['help'])
-def help_command(message):
-    """Help information"""
-    help_text = """
+HELP_TEXT = """
 📚 **PCOS Care AI - Help**
 
 **Available Commands:**
@@ -251,14 +328,9 @@ def help_command(message):
 🔴 High (>70%): Urgent medical attention
 
 **Note:** This is a screening tool, not a diagnosis. Always consult healthcare professionals.
-    """
-    bot.send_message(message.chat.id, help_text, parse_mode='Markdown')
-
+"""
 
-@bot.message_handler(commands=['about'])
-def about_pcos(message):
-    """Information about PCOS"""
-    about_text = """
+ABOUT_TEXT = """
 🔬 **About PCOS (Polycystic Ovary Syndrome)**
 
 PCOS is a common hormonal disorder affecting women of reproductive age.
@@ -290,14 +362,9 @@ PCOS is a common hormonal disorder affecting women of reproductive age.
 ✅ Many women lead healthy lives
 
 Type /assess to check your risk!
-    """
-    bot.send_message(message.chat.id, about_text, parse_mode='Markdown')
-
+"""
 
-@bot.message_handler(commands=['logic'])
-def show_logic(message):
-    """Display the scoring algorithm and decision logic"""
-    logic_text = """
+LOGIC_TEXT = """
 🧮 **PCOS Risk Scoring Algorithm**
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -336,23 +403,113 @@ ELSE IF 30 ≤ Percentage ≤ 70 THEN
    
 ELSE IF Percentage > 70 THEN
    Risk = HIGH
-    """
-    bot.send_message(message.chat.id, logic_text, parse_mode='Markdown')
+"""
+
+DISCLAIMER_TEXT = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+⚕️ **IMPORTANT DISCLAIMER**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+This assessment is a screening tool only and NOT a medical diagnosis. 
+
+✅ **Next Steps:**
+• Consult a gynecologist or endocrinologist
+• Get proper diagnostic tests
+• Follow medical advice
+
+**Questions?** Type /help
+**New Assessment?** Type /assess
+
+Thank you for using PCOS Care AI! 🌸
+"""
+
+REPORT_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 **PCOS RISK ASSESSMENT REPORT**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+**Date:** {date}
+
+**Your Inputs:**
+• Cycle: {regularity}
+• Length: {length} days
+• Symptoms: {symptoms}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{risk_msg}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+**📋 Personalized Recommendations:**
+
+{reco_block}
+
+{daily}{disclaimer}"""
+
+
+# Reply keyboards (static, built once and reused for every message)
+KB_REGULARITY = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
+KB_REGULARITY.add('Regular', 'Irregular', 'None')
+
+KB_LENGTH = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
+KB_LENGTH.add('Less than 21', '21-35 (Normal)', 'More than 35', 'Variable/Unsure')
+
+KB_SYMPTOMS = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
+KB_SYMPTOMS.add('Acne', 'Facial Hair', 'Weight Gain', 'Hair Thinning')
+KB_SYMPTOMS.add('None of these', 'Done')
+
+KB_REMOVE = types.ReplyKeyboardRemove()
+
+# Accepted answers
+REG_OPTIONS = frozenset(('Regular', 'Irregular', 'None'))
+
+# Map cycle length answers to numeric values
+LENGTH_MAP = {
+    'Less than 21': '20',
+    '21-35 (Normal)': '28',
+    'More than 35': '40',
+    'Variable/Unsure': '35'
+}
+
+
+# Bot Commands
+
+@bot.message_handler(commands=['start'])
+def start(message):
+    """Welcome message and introduction"""
+    user_id = message.from_user.id
+    set_user(user_id, Session())
+    
+    bot.send_message(message.chat.id, WELCOME_TEXT, parse_mode='Markdown')
+
+
+@bot.message_handler(commands=['help'])
+def help_command(message):
+    """Help information"""
+    bot.send_message(message.chat.id, HELP_TEXT, parse_mode='Markdown')
+
+
+@bot.message_handler(commands=['about'])
+def about_pcos(message):
+    """Information about PCOS"""
+    bot.send_message(message.chat.id, ABOUT_TEXT, parse_mode='Markdown')
+
+
+@bot.message_handler(commands=['logic'])
+def show_logic(message):
+    """Display the scoring algorithm and decision logic"""
+    bot.send_message(message.chat.id, LOGIC_TEXT, parse_mode='Markdown')
 
 
 @bot.message_handler(commands=['assess'])
 def start_assessment(message):
     """Begin the PCOS assessment"""
     user_id = message.from_user.id
-    user_data[user_id] = {'stage': 'cycle_regularity'}
-    
-    markup = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
-    markup.add('Regular', 'Irregular', 'None')
+    set_user(user_id, Session(stage='cycle_regularity'))
     
     bot.send_message(
         message.chat.id,
         "🩺 **PCOS Risk Assessment**\n\n**Question 1/3:**\nHow would you describe your menstrual cycle?",
-        reply_markup=markup,
+        reply_markup=KB_REGULARITY,
         parse_mode='Markdown'
     )
 
@@ -361,12 +518,13 @@ def start_assessment(message):
 def handle_responses(message):
     """Handle all user responses during assessment"""
     user_id = message.from_user.id
+    data = get_user(user_id)
     
-    if user_id not in user_data:
+    if data is None:
         bot.send_message(message.chat.id, "Please start with /assess command")
         return
     
-    stage = user_data[user_id].get('stage')
+    stage = data.stage
     
     if stage == 'cycle_regularity':
         handle_cycle_regularity(message)
@@ -378,94 +536,74 @@ def handle_responses(message):
 
 def handle_cycle_regularity(message):
     """Handle cycle regularity response"""
-    user_id = message.from_user.id
+    data = get_user(message.from_user.id)
     response = message.text
     
-    if response not in ['Regular', 'Irregular', 'None']:
+    if response not in REG_OPTIONS:
         bot.send_message(message.chat.id, "Please select from the options provided.")
         return
     
-    user_data[user_id]['cycle_regularity'] = response
-    user_data[user_id]['stage'] = 'cycle_length'
+    data.cycle_regularity = response
+    data.stage = 'cycle_length'
     
     if response == 'None':
-        user_data[user_id]['cycle_length'] = '0'
+        data.cycle_length = '0'
         ask_symptoms(message)
     else:
-        markup = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
-        markup.add('Less than 21', '21-35 (Normal)', 'More than 35', 'Variable/Unsure')
-        
         bot.send_message(
             message.chat.id,
             "**Question 2/3:**\nWhat is your typical cycle length (in days)?",
-            reply_markup=markup,
+            reply_markup=KB_LENGTH,
             parse_mode='Markdown'
         )
 
 
 def handle_cycle_length(message):
     """Handle cycle length response"""
-    user_id = message.from_user.id
+    data = get_user(message.from_user.id)
     response = message.text
     
-    # Map responses to numeric values
-    length_map = {
-        'Less than 21': '20',
-        '21-35 (Normal)': '28',
-        'More than 35': '40',
-        'Variable/Unsure': '35'
-    }
-    
-    if response in length_map:
-        user_data[user_id]['cycle_length'] = length_map[response]
+    if response in LENGTH_MAP:
+        data.cycle_length = LENGTH_MAP[response]
+    elif response.strip().isdecimal():
+        # Typed a number of days
+        data.cycle_length = str(int(response))
     else:
-        # Try to parse as number
-        try:
-            days = int(response)
-            user_data[user_id]['cycle_length'] = str(days)
-        except:
-            bot.send_message(message.chat.id, "Please provide a valid response.")
-            return
+        bot.send_message(message.chat.id, "Please provide a valid response.")
+        return
     
     ask_symptoms(message)
 
 
 def ask_symptoms(message):
     """Ask about physical symptoms"""
-    user_id = message.from_user.id
-    user_data[user_id]['stage'] = 'symptoms'
-    
-    markup = types.ReplyKeyboardMarkup(one_time_keyboard=True, resize_keyboard=True)
-    markup.add('Acne', 'Facial Hair', 'Weight Gain', 'Hair Thinning')
-    markup.add('None of these', 'Done')
+    get_user(message.from_user.id).stage = 'symptoms'
     
     bot.send_message(
         message.chat.id,
         "**Question 3/3:**\nDo you experience any of these symptoms?\n\n(Select one at a time, then click 'Done' when finished)",
-        reply_markup=markup,
+        reply_markup=KB_SYMPTOMS,
         parse_mode='Markdown'
     )
 
 
 def handle_symptoms(message):
     """Handle symptom selection"""
-    user_id = message.from_user.id
+    data = get_user(message.from_user.id)
     response = message.text
     
-    if 'symptoms' not in user_data[user_id]:
-        user_data[user_id]['symptoms'] = []
-    
     if response == 'Done' or response == 'None of these':
         generate_report(message)
-    elif response in ['Acne', 'Facial Hair', 'Weight Gain', 'Hair Thinning']:
-        if response not in user_data[user_id]['symptoms']:
-            user_data[user_id]['symptoms'].append(response)
+    elif response in SYMPTOM_BIT:
+        bit = SYMPTOM_BIT[response]
+        if data.sym_mask & bit:
+            bot.send_message(message.chat.id, f"{response} already selected.")
+        else:
+            data.sym_mask |= bit
             bot.send_message(
                 message.chat.id,
                 f"✅ {response} added. Select more or click 'Done'."
             )
-        else:
-            bot.send_message(message.chat.id, f"{response} already selected.")
     else:
         bot.send_message(message.chat.id, "Please select from the options.")
 
@@ -473,7 +611,7 @@ def handle_symptoms(message):
 def generate_report(message):
     """Generate final PCOS risk report"""
     user_id = message.from_user.id
-    data = user_data[user_id]
+    data = get_user(user_id)
     
     # Calculate score
     percentage = PCOSScorer.calculate_total_score(data)
@@ -483,72 +621,44 @@ def generate_report(message):
     reco = get_recommendations(risk_category, percentage)
     
     # Build report
-    report = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 **PCOS RISK ASSESSMENT REPORT**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-**Your Inputs:**
-• Cycle: {data.get('cycle_regularity', 'N/A')}
-• Length: {data.get('cycle_length', 'N/A')} days
-• Symptoms: {', '.join(data.get('symptoms', ['None']))}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{reco['message']}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-**📋 Personalized Recommendations:**
-
-"""
-    
-    for rec in reco['recommendations']:
-        report += f"{rec}\n\n"
-    
-    report += get_daily_precautions()
-    
-    report += """
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-⚕️ **IMPORTANT DISCLAIMER**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-This assessment is a screening tool only and NOT a medical diagnosis. 
-
-✅ **Next Steps:**
-• Consult a gynecologist or endocrinologist
-• Get proper diagnostic tests
-• Follow medical advice
-
-**Questions?** Type /help
-**New Assessment?** Type /assess
-
-Thank you for using PCOS Care AI! 🌸
-    """
+    report = REPORT_TEMPLATE.format_map({
+        'date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'regularity': data.cycle_regularity,
+        'length': data.cycle_length,
+        'symptoms': ', '.join(symptom_names(data.sym_mask)) or 'None',
+        'risk_msg': reco['message'],
+        'reco_block': '\n\n'.join(reco['recommendations']),
+        'daily': DAILY_PRECAUTIONS,
+        'disclaimer': DISCLAIMER_TEXT
+    })
     
     # Remove keyboard
-    markup = types.ReplyKeyboardRemove()
-    bot.send_message(message.chat.id, report, parse_mode='Markdown', reply_markup=markup)
+    bot.send_message(message.chat.id, report, parse_mode='Markdown', reply_markup=KB_REMOVE)
     
     # Clear user data
-    user_data[user_id] = {}
+    set_user(user_id, Session())
+
+
+def setup_webhook():
+    """Point Telegram at the webhook route of this service"""
+    print("🤖 PCOS Care AI Bot is starting (webhook mode)...")
+    # set_webhook replaces any existing hook; a failure must not stop the
+    # web server, so health checks keep answering while Telegram is unreachable
+    try:
+        bot.set_webhook(url=f"{RENDER_EXTERNAL_URL}/{BOT_TOKEN}")
+    except Exception as e:
+        # Error messages embed the request URL (and so the token); log the type only
+        print(f"⚠️ Could not register webhook ({type(e).__name__})")
 
 
 def run_bot():
-    """Run the bot with polling"""
+    """Run the bot with polling (local development without a public URL)"""
     print("🤖 PCOS Care AI Bot is starting...")
-    bot.infinity_polling()
+    bot.remove_webhook()
+    # Let Telegram hold each getUpdates open for up to 50s while idle
+    bot.infinity_polling(timeout=20, long_polling_timeout=50)
 
 
 if __name__ == '__main__':
-    # Run Flask app in a separate thread
-    port = int(os.environ.get('PORT', 10000))
-    
-    # Start bot in background thread
-    bot_thread = Thread(target=run_bot)
-    bot_thread.daemon = True
-    bot_thread.start()
-    
-    # Run Flask app (this keeps the service alive for Render)
-    print(f"🌐 Starting web server on port {port}...")
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+    # Production runs under gunicorn (see gunicorn.conf.py); this is local polling
+    run_bot()
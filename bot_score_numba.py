@@ -0,0 +1,97 @@
+"""
+PCOS Care AI - Batch Scoring
+Vectorized versions of PCOSScorer.calculate_total_score and get_risk_category
+for re-scoring many sessions at once (analytics, what-if reports). Scoring uses
+Numba when installed and falls back to the same loop in plain Python otherwise.
+
+Requires numpy; numba is optional (pip install -r requirements-analytics.txt).
+"""
+
+import numpy as np
+
+from bot import WEIGHTS, CYCLE_LENGTH_WEIGHT, MAX_CYCLE_DAYS, SYMPTOM_BIT
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Cycle regularity is encoded as an index into REGULARITY_CODES
+REGULARITY_CODES = {'Regular': 0, 'Irregular': 1, 'None': 2}
+REGULARITY_NONE = REGULARITY_CODES['None']
+
+# Symptoms use the Session.sym_mask layout, bit i set for SYMPTOM_ORDER[i]
+SYMPTOM_ORDER = tuple(sorted(SYMPTOM_BIT, key=SYMPTOM_BIT.get))
+
+# Risk labels indexed by bucket, matching PCOSScorer.get_risk_category
+RISK_LABELS = np.array(['Low', 'Medium', 'High'])
+
+REG_WEIGHT = np.array(
+    [WEIGHTS['cycle_regularity'][name] for name in REGULARITY_CODES], np.int32
+)
+LEN_WEIGHT = np.array(CYCLE_LENGTH_WEIGHT, np.int32)
+NO_CYCLE_WEIGHT = WEIGHTS['cycle_length']['none']
+SYMPTOM_WEIGHT = np.array(
+    [WEIGHTS['symptoms'][name] for name in SYMPTOM_ORDER], np.int32
+)
+
+
+def _jit(func):
+    """Compile with Numba if available, otherwise run as plain Python"""
+    if _NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+@_jit
+def score_batch(reg, length, sym_mask):
+    """Score packed sessions, returning the risk percentage for each one"""
+    n = reg.shape[0]
+    out = np.empty(n, np.int32)
+    for i in range(n):
+        r = reg[i]
+        s = REG_WEIGHT[r]
+
+        if r == REGULARITY_NONE:
+            s += NO_CYCLE_WEIGHT
+        else:
+            s += LEN_WEIGHT[min(max(length[i], 0), MAX_CYCLE_DAYS)]
+
+        m = sym_mask[i]
+        for bit in range(SYMPTOM_WEIGHT.shape[0]):
+            s += SYMPTOM_WEIGHT[bit] * ((m >> bit) & 1)
+
+        out[i] = min(s, 100)
+    return out
+
+
+def categorize_batch(percentages):
+    """Bucket an array of risk percentages into Low/Medium/High labels"""
+    percentages = np.asarray(percentages)
+    # < 30 is Low, 30-70 inclusive is Medium, > 70 is High
+    bucket = (percentages >= 30).astype(np.intp) + (percentages > 70)
+    return RISK_LABELS[bucket]
+
+
+def encode_session(data):
+    """Pack a session into (regularity_code, cycle_length_days, symptom_mask)"""
+    regularity = REGULARITY_CODES.get(data.cycle_regularity, 0)
+    try:
+        # Clamp to the kernel's table range so any accepted answer fits int32
+        length = min(max(int(data.cycle_length), 0), MAX_CYCLE_DAYS)
+    except ValueError:
+        length = 28
+
+    return regularity, length, data.sym_mask
+
+
+def encode_sessions(sessions):
+    """Pack an iterable of sessions into the arrays taken by score_batch"""
+    packed = np.array([encode_session(data) for data in sessions], np.int32).reshape(-1, 3)
+    return packed[:, 0].copy(), packed[:, 1].copy(), packed[:, 2].copy()
+
+
+# Compile once at import so the first real call doesn't pay for the JIT
+if _NUMBA_AVAILABLE:
+    score_batch(np.zeros(1, np.int32), np.zeros(1, np.int32), np.zeros(1, np.int32))
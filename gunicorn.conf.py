@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for Render
+Start command: gunicorn -c gunicorn.conf.py bot:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+
+# Assessment sessions live in process memory (user_data), so every update
+# from a user must reach the same process: one worker, many threads
+workers = 1
+worker_class = 'gthread'
+threads = 8
+
+
+def post_worker_init(worker):
+    """Register the Telegram webhook once the worker has loaded the app"""
+    from bot import RENDER_EXTERNAL_URL, setup_webhook
+
+    if RENDER_EXTERNAL_URL:
+        setup_webhook()
@@ -0,0 +1,21 @@
+from urllib.parse import quote
+
+import bot
+
+
+def test_setup_webhook_failure_does_not_log_token(monkeypatch, capsys):
+    """A failed registration is logged without the raw or URL-encoded token"""
+    token = '123:abc'
+    monkeypatch.setattr(bot, 'BOT_TOKEN', token)
+    monkeypatch.setattr(bot, 'RENDER_EXTERNAL_URL', 'https://example.invalid')
+
+    def fail(url):
+        raise ConnectionError(f"/bot{token}/setWebhook?url={quote(url, safe='')}")
+
+    monkeypatch.setattr(bot.bot, 'set_webhook', fail)
+    bot.setup_webhook()
+
+    out = capsys.readouterr().out
+    assert 'Could not register webhook' in out
+    assert token not in out
+    assert quote(token, safe='') not in out
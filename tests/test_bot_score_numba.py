@@ -0,0 +1,17 @@
+import bot
+import bot_score_numba
+
+
+def test_encode_session_clamps_out_of_range_lengths():
+    """Lengths the bot accepts but int32 can't hold are clamped, not rejected"""
+    sessions = [
+        bot.Session(cycle_regularity='Regular', cycle_length='99999999999'),
+        bot.Session(cycle_regularity='Irregular', cycle_length='-5', sym_mask=3),
+        bot.Session(cycle_regularity='Regular', cycle_length='28'),
+    ]
+
+    assert bot_score_numba.encode_session(sessions[0])[1] == bot.MAX_CYCLE_DAYS
+    assert bot_score_numba.encode_session(sessions[1])[1] == 0
+
+    scores = bot_score_numba.score_batch(*bot_score_numba.encode_sessions(sessions))
+    assert list(scores) == [bot.PCOSScorer.calculate_total_score(s) for s in sessions]